@@ -5,6 +5,18 @@ from build123d.geometry import Color, Vector, VectorLike, Location
 from build123d.mesher import Mesher
 
 
+def _test_file_name(test_case: unittest.TestCase) -> str:
+    """Unique 3mf file name for a test, removed when the test finishes"""
+    file_name = f"test-{uuid.uuid4().hex}.3mf"
+
+    def _remove():
+        if os.path.exists(file_name):
+            os.remove(file_name)
+
+    test_case.addCleanup(_remove)
+    return file_name
+
+
 class DirectApiTestCase(unittest.TestCase):
     def assertTupleAlmostEquals(
         self,
@@ -33,12 +45,13 @@ class TestProperties(unittest.TestCase):
         self.assertEqual(exporter.library_version, "2.2.0")
 
     def test_units(self):
+        file_name = _test_file_name(self)
         for unit in Unit:
             exporter = Mesher(unit=unit)
             exporter.add_shape(Solid.make_box(1, 1, 1))
-            exporter.write("test.3mf")
+            exporter.write(file_name)
             importer = Mesher()
-            _shape = importer.read("test.3mf")
+            _shape = importer.read(file_name)
             self.assertEqual(unit, importer.model_unit)
 
     def test_vertex_and_triangle_counts(self):
@@ -56,13 +69,14 @@ class TestProperties(unittest.TestCase):
 
 class TestMetaData(unittest.TestCase):
     def test_add_meta_data(self):
+        file_name = _test_file_name(self)
         exporter = Mesher()
         exporter.add_shape(Solid.make_box(1, 1, 1))
         exporter.add_meta_data("test_space", "test0", "some data", "str", True)
         exporter.add_meta_data("test_space", "test1", "more data", "str", True)
-        exporter.write("test.3mf")
+        exporter.write(file_name)
         importer = Mesher()
-        _shape = importer.read("test.3mf")
+        _shape = importer.read(file_name)
         imported_meta_data: list[dict] = importer.get_meta_data()
         self.assertEqual(imported_meta_data[0]["name_space"], "test_space")
         self.assertEqual(imported_meta_data[0]["name"], "test0")
@@ -74,12 +88,13 @@ class TestMetaData(unittest.TestCase):
         self.assertEqual(imported_meta_data[1]["type"], "str")
 
     def test_add_code(self):
+        file_name = _test_file_name(self)
         exporter = Mesher()
         exporter.add_shape(Solid.make_box(1, 1, 1))
         exporter.add_code_to_metadata()
-        exporter.write("test.3mf")
+        exporter.write(file_name)
         importer = Mesher()
-        _shape = importer.read("test.3mf")
+        _shape = importer.read(file_name)
         source_code = importer.get_meta_data_by_key("build123d", "test_mesher.py")
         self.assertEqual(len(source_code), 2)
         self.assertEqual(source_code["type"], "python")
@@ -88,6 +103,7 @@ class TestMetaData(unittest.TestCase):
 
 class TestMeshProperties(unittest.TestCase):
     def test_properties(self):
+        file_name = _test_file_name(self)
         # Note: MeshType.OTHER can't be used with a Solid shape
         for mesh_type in [MeshType.MODEL, MeshType.SUPPORT, MeshType.SOLIDSUPPORT]:
             with self.subTest("MeshTYpe", mesh_type=mesh_type):
@@ -105,9 +121,9 @@ class TestMeshProperties(unittest.TestCase):
                     part_number=str(mesh_type.value),
                     uuid_value=test_uuid,
                 )
-                exporter.write("test.3mf")
+                exporter.write(file_name)
                 importer = Mesher()
-                shape = importer.read("test.3mf")
+                shape = importer.read(file_name)
                 self.assertEqual(shape[0].label, name)
                 self.assertEqual(importer.mesh_count, 1)
                 properties = importer.get_mesh_properties()
@@ -120,6 +136,7 @@ class TestMeshProperties(unittest.TestCase):
 
 class TestAddShape(DirectApiTestCase):
     def test_add_shape(self):
+        file_name = _test_file_name(self)
         exporter = Mesher()
         blue_shape = Solid.make_box(1, 1, 1)
         blue_shape.color = Color("blue")
@@ -128,9 +145,9 @@ class TestAddShape(DirectApiTestCase):
         red_shape.color = Color("red")
         red_shape.label = "red"
         exporter.add_shape([blue_shape, red_shape])
-        exporter.write("test.3mf")
+        exporter.write(file_name)
         importer = Mesher()
-        box, cone = importer.read("test.3mf")
+        box, cone = importer.read(file_name)
         self.assertVectorAlmostEquals(box.bounding_box().size, (1, 1, 1), 2)
         self.assertVectorAlmostEquals(box.bounding_box().size, (1, 1, 1), 2)
         self.assertEqual(len(box.clean().faces()), 6)
@@ -140,14 +157,15 @@ class TestAddShape(DirectApiTestCase):
         self.assertTupleAlmostEquals(cone.color.to_tuple(), (1, 0, 0, 1), 5)
 
     def test_add_compound(self):
+        file_name = _test_file_name(self)
         exporter = Mesher()
         box = Solid.make_box(1, 1, 1)
         cone = Solid.make_cone(1, 0, 2).locate(Location((0, -1, 0)))
         shape_assembly = Compound.make_compound([box, cone])
         exporter.add_shape(shape_assembly)
-        exporter.write("test.3mf")
+        exporter.write(file_name)
         importer = Mesher()
-        shapes = importer.read("test.3mf")
+        shapes = importer.read(file_name)
         self.assertEqual(importer.mesh_count, 2)
 
 